@@ -1,6 +1,8 @@
 # backend/app/main.py - CORRECTED VERSION
 
-from fastapi import FastAPI, HTTPException, Response
+import asyncio
+from typing import List
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware # <<< MISSING IMPORT
 from pydantic import BaseModel # <<< REQUIRED for /analyze POST body
 from dotenv import load_dotenv
@@ -9,7 +11,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # Import services
-from app.services.crawler import crawl_website_data        # <<< MISSING IMPORT
+from app.services.crawler import crawl_website_data, create_session
 from app.services.gemini_analyzer import analyze_with_gemini # <<< MISSING IMPORT
 from app.services.pdf_generator import generate_seo_pdf 
 
@@ -35,10 +37,41 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# --- Shared HTTP client (one connection pool for the whole app) ---
+@app.on_event("startup")
+async def open_http_session():
+    app.state.http = create_session()
+
+@app.on_event("shutdown")
+async def close_http_session():
+    await app.state.http.close()
+
 # --- Pydantic Schema for Input ---
 class AnalysisRequest(BaseModel):
     url: str
 
+class BatchAnalysisRequest(BaseModel):
+    urls: List[str]
+
+# Upper bound on URLs audited concurrently by one /analyze_batch call
+MAX_BATCH_URLS = 10
+
+# --- Audit Pipeline ---
+async def run_audit(session, url: str) -> dict:
+    """Crawls a URL and runs the Gemini analysis; failures come back as {"error": ...}."""
+    crawled_data = await crawl_website_data(session, url)
+    if "error" in crawled_data:
+        return {"error": crawled_data["error"]}
+
+    seo_report_data = await analyze_with_gemini(crawled_data)
+    if "error" in seo_report_data:
+        return {"error": seo_report_data["error"]}
+
+    return {
+        "crawled_data": crawled_data,
+        "seo_report": seo_report_data
+    }
+
 # --- Endpoints ---
 
 @app.get("/")
@@ -47,25 +80,36 @@ def read_root():
 
 # <<< CRITICAL MISSING ENDPOINT: /analyze >>>
 @app.post("/analyze")
-def analyze_url(request: AnalysisRequest):
+async def analyze_url(request: AnalysisRequest, http_request: Request):
     """Endpoint to trigger website crawl and Gemini SEO analysis."""
     url = request.url.strip()
     if not url.startswith(('http://', 'https://')):
         raise HTTPException(status_code=400, detail="URL must start with http:// or https://")
     
-    crawled_data = crawl_website_data(url)
-    if "error" in crawled_data:
-        raise HTTPException(status_code=500, detail=crawled_data["error"])
-    
-    seo_report_data = analyze_with_gemini(crawled_data)
-    
-    if "error" in seo_report_data:
-        raise HTTPException(status_code=500, detail=seo_report_data["error"])
+    result = await run_audit(http_request.app.state.http, url)
+    if "error" in result:
+        raise HTTPException(status_code=500, detail=result["error"])
 
-    return {
-        "crawled_data": crawled_data,
-        "seo_report": seo_report_data
-    }
+    return result
+
+@app.post("/analyze_batch")
+async def analyze_batch(request: BatchAnalysisRequest, http_request: Request):
+    """Audits several URLs concurrently; each result carries either the report or its own error."""
+    urls = [u.strip() for u in request.urls]
+    if not urls or len(urls) > MAX_BATCH_URLS:
+        raise HTTPException(status_code=400, detail=f"Provide between 1 and {MAX_BATCH_URLS} URLs")
+
+    async def audit_one(url: str) -> dict:
+        if not url.startswith(('http://', 'https://')):
+            return {"url": url, "error": "URL must start with http:// or https://"}
+        # Contain unexpected failures to this URL so one bad site doesn't fail the whole batch
+        try:
+            return {"url": url, **await run_audit(http_request.app.state.http, url)}
+        except Exception as e:
+            return {"url": url, "error": f"Audit failed: {e}"}
+
+    results = await asyncio.gather(*[audit_one(u) for u in urls])
+    return {"results": results}
 
 # <<< EXISTING /download ENDPOINT (No changes needed) >>>
 @app.post("/download")
@@ -75,13 +119,15 @@ def download_report(request: dict):
     if not report_data:
          raise HTTPException(status_code=400, detail="Missing SEO report data.")
     
+    # generate_seo_pdf returns the cached bytes for a report it rendered recently,
+    # so hand them to the response directly
     try:
         pdf_bytes = generate_seo_pdf(report_data)
-
-        return Response(
-            content=pdf_bytes, 
-            media_type="application/pdf", 
-            headers={"Content-Disposition": "attachment; filename=AI_SEO_Audit_Report.pdf"}
-        )
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"PDF Generation Failed: {e}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"PDF Generation Failed: {e}")
+
+    return Response(
+        content=pdf_bytes, 
+        media_type="application/pdf", 
+        headers={"Content-Disposition": "attachment; filename=AI_SEO_Audit_Report.pdf"}
+    )
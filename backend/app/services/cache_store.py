@@ -0,0 +1,40 @@
+# backend/app/services/cache_store.py
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+# Single SQLite key/value store replacing the old file-per-URL JSON cache
+CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', '..', '.cache')
+os.makedirs(CACHE_DIR, exist_ok=True)
+DB_PATH = os.path.join(CACHE_DIR, 'cache.sqlite3')
+
+# Tables share the (key, expires, blob) layout; names are whitelisted since they can't be bound as parameters
+TABLES = ('cache', 'gemini_cache')
+
+# Autocommit connection; callers are on the event loop today, but check_same_thread is off
+# and access goes through _LOCK so code running in worker threads can share it too
+DB = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+DB.execute('PRAGMA journal_mode=WAL')
+DB.execute('PRAGMA synchronous=NORMAL')
+for _table in TABLES:
+    DB.execute(f'CREATE TABLE IF NOT EXISTS {_table} (key TEXT PRIMARY KEY, expires REAL, blob BLOB)')
+_LOCK = threading.Lock()
+
+def get_blob(table: str, key: str) -> Optional[bytes]:
+    """Returns the stored blob for key, or None when missing or expired."""
+    if table not in TABLES:
+        raise ValueError(f"Unknown cache table: {table}")
+    with _LOCK:
+        row = DB.execute(f'SELECT blob FROM {table} WHERE key=? AND expires>?', (key, time.time())).fetchone()
+    return row[0] if row else None
+
+def put_blob(table: str, key: str, blob: bytes, ttl_seconds: float) -> None:
+    """Stores blob under key, expiring ttl_seconds from now."""
+    if table not in TABLES:
+        raise ValueError(f"Unknown cache table: {table}")
+    with _LOCK:
+        DB.execute(f'INSERT OR REPLACE INTO {table} (key, expires, blob) VALUES (?, ?, ?)',
+                   (key, time.time() + ttl_seconds, blob))
@@ -1,56 +1,289 @@
 # backend/app/services/crawler.py
 
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import codecs
+import aiohttp
+import ahocorasick
+from selectolax.lexbor import LexborHTMLParser
 from urllib.parse import urlparse
 from .seo_scorer import SEOScorer # Add the leading dot back
+from . import cache_store
 import time
 import re
-from collections import Counter
-from typing import Dict, List, Any, Optional
-import os
-import json
+from collections import Counter, OrderedDict
+import copy
+from typing import Dict, List, Any, Optional, Tuple
 import hashlib
-from datetime import datetime, timedelta
 
-# Persistent requests session to reuse connections
-SESSION = requests.Session()
-SESSION.headers.update({
+# orjson is much faster for the cache round-trip; fall back to the stdlib if it's unavailable
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_dumps = lambda obj: json.dumps(obj).encode('utf-8')
+    _json_loads = json.loads
+
+# Default headers for the application-scoped aiohttp session
+DEFAULT_HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-})
+}
+
+# Connection pool and retry settings for all crawler traffic
+POOL_LIMIT = 64
+POOL_LIMIT_PER_HOST = 32
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.2
+RETRY_STATUSES = {502, 503, 504}
+
+# Download budgets; parse time is linear in input size, so stop reading past these
+FAST_MAX_BYTES = 200_000
+MAX_BYTES = 2_000_000
+
+# Outcomes of the robots.txt / sitemap.xml HEAD probes
+PROBE_FOUND = "Found"
+PROBE_MISSING = "Not Found"
+PROBE_FAILED = "Unknown"
+PROBE_SKIPPED = "Not checked"  # fast mode doesn't probe
+
+# Characters of page copy kept for content analysis; enough context for topic/service detection
+TEXT_BUDGET = 4096
+
+# In-process caches for platform/content analysis, keyed by a BLAKE2 hash of the page body
+ANALYSIS_CACHE_SIZE = 256
+_PLATFORM_CACHE: OrderedDict = OrderedDict()
+_CONTENT_CACHE: OrderedDict = OrderedDict()
+
+# Internal link markers for service/product pages
+_SERVICE_TERMS = ('service', 'product', 'solution', 'consulting', 'about')
+
+# Topic candidates: word runs longer than three characters
+_WORD_RE = re.compile(r'\w{4,}')
+
+# Service-offering phrases, one capturing group per phrase family
+_SERVICE_RE = re.compile(
+    r'(we (?:offer|provide|deliver|specialize in))'
+    r'|(our (?:services|solutions|products|expertise))'
+    r'|(specialized in)'
+    r'|(expert in)'
+    r'|(consulting for)'
+)
+
+# Target audience indicators, one alternation per audience type
+_AUDIENCE_RES = {
+    audience_type: re.compile('|'.join(map(re.escape, indicators)))
+    for audience_type, indicators in {
+        'businesses': ['business', 'company', 'corporate', 'enterprise', 'organization'],
+        'consumers': ['individual', 'personal', 'consumer', 'customer', 'user'],
+        'professionals': ['professional', 'expert', 'specialist', 'practitioner'],
+        'students': ['student', 'learner', 'education', 'academic'],
+    }.items()
+}
 
-# Simple file cache directory
-CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', '..', '.cache')
-os.makedirs(CACHE_DIR, exist_ok=True)
+async def _timed_fetch(session: aiohttp.ClientSession, url: str, timeout: float, max_bytes: int) -> Tuple[bytes, str, float]:
+    """Like _fetch, but also returns the page's own load time in seconds."""
+    start_time = time.time()
+    content, encoding = await _fetch(session, url, timeout, max_bytes)
+    return content, encoding, time.time() - start_time
 
-def _cache_path_for_url(url: str) -> str:
-    key = hashlib.md5(url.encode('utf-8')).hexdigest()
-    return os.path.join(CACHE_DIR, f"{key}.json")
+async def _probe(session: aiohttp.ClientSession, url: str, timeout: float) -> str:
+    """HEADs a well-known resource (robots.txt, sitemap.xml) and reports whether it exists."""
+    try:
+        async with session.head(url, allow_redirects=True, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            return PROBE_FOUND if response.status < 400 else PROBE_MISSING
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return PROBE_FAILED
 
-def _load_cache(url: str, ttl_seconds: int) -> Optional[dict]:
-    path = _cache_path_for_url(url)
-    if not os.path.exists(path):
-        return None
+def create_session() -> aiohttp.ClientSession:
+    """
+    Creates the application-scoped session; its keep-alive connector pools
+    connections so repeated audits of a host skip the TCP/TLS handshake.
+    """
+    connector = aiohttp.TCPConnector(limit=POOL_LIMIT, limit_per_host=POOL_LIMIT_PER_HOST, keepalive_timeout=30)
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=10),
+        headers=DEFAULT_HEADERS,
+    )
+
+async def _read_capped(response: aiohttp.ClientResponse, max_bytes: int) -> bytes:
+    """Streams the body and stops pulling from the socket once max_bytes have arrived."""
+    buf = bytearray()
+    async for chunk in response.content.iter_chunked(65536):
+        buf.extend(chunk)
+        if len(buf) >= max_bytes:
+            break
+    return bytes(buf[:max_bytes])
+
+def _text_encoding(charset: Optional[str]) -> str:
+    """Returns the response charset when Python knows it as a text encoding, else utf-8."""
+    if charset:
+        try:
+            if getattr(codecs.lookup(charset), '_is_text_encoding', True):
+                return charset
+        except LookupError:
+            pass
+    return 'utf-8'
+
+async def _fetch(session: aiohttp.ClientSession, url: str, timeout: float, max_bytes: int) -> Tuple[bytes, str]:
+    """GETs up to max_bytes of a URL, retrying gateway errors and dropped connections with exponential backoff."""
+    for attempt in range(MAX_RETRIES + 1):
+        last_attempt = attempt == MAX_RETRIES
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                if last_attempt or response.status not in RETRY_STATUSES:
+                    response.raise_for_status()
+                    return await _read_capped(response, max_bytes), _text_encoding(response.charset)
+        except aiohttp.ClientConnectionError:
+            if last_attempt:
+                raise
+        await asyncio.sleep(RETRY_BACKOFF * (2 ** attempt))
+
+def _cache_key(url: str) -> str:
+    return hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+
+def _load_cache(url: str) -> Optional[dict]:
     try:
-        mtime = datetime.fromtimestamp(os.path.getmtime(path))
-        if datetime.now() - mtime > timedelta(seconds=ttl_seconds):
-            return None
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        blob = cache_store.get_blob('cache', _cache_key(url))
+        return _json_loads(blob) if blob else None
     except Exception:
         return None
 
-def _save_cache(url: str, data: dict) -> None:
-    path = _cache_path_for_url(url)
+def _save_cache(url: str, data: dict, ttl_seconds: int) -> None:
     try:
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f)
+        cache_store.put_blob('cache', _cache_key(url), _json_dumps(data), ttl_seconds)
     except Exception:
         pass
 
-def detect_platform(soup: BeautifulSoup, html_content: str, url: str) -> Dict[str, Any]:
+def _lru_lookup(cache: OrderedDict, key: tuple, compute) -> Any:
+    """
+    Returns a copy of cache[key], computing and storing the value on a miss and
+    evicting the least recently used entry once ANALYSIS_CACHE_SIZE is exceeded.
+    """
+    if key in cache:
+        cache.move_to_end(key)
+    else:
+        cache[key] = compute()
+        if len(cache) > ANALYSIS_CACHE_SIZE:
+            cache.popitem(last=False)
+    return copy.deepcopy(cache[key])
+
+def _bounded_text(node, budget: int = TEXT_BUDGET) -> str:
+    """
+    Joins the stripped text fragments under a node, stopping once `budget`
+    characters are collected instead of materializing the whole body.
+    """
+    parts = []
+    total = 0
+    for child in node.traverse(include_text=True):
+        if child.tag != '-text':
+            continue
+        fragment = (child.text_content or '').strip()
+        if not fragment:
+            continue
+        parts.append(fragment)
+        total += len(fragment) + 1
+        if total >= budget:
+            break
+    # A single large text node can overshoot the budget on its own, so cut the result too
+    return ' '.join(parts)[:budget]
+
+# Platform signatures, matched against the lowercased HTML (hosting: against the URL).
+# Dict order is the detection priority.
+CMS_PATTERNS = {
+    'WordPress': ['wp-content', 'wp-includes', 'wordpress'],
+    'Shopify': ['shopify', '.myshopify.com'],
+    'Wix': ['wix-viewer', 'wixsite.com', '_wixCss', '_wixJs'],
+    'Squarespace': ['squarespace', 'static1.squarespace'],
+    'Webflow': ['webflow', '.webflow.com', 'webflow.js'],
+    'Drupal': ['drupal', 'sites/all', 'drupal.js'],
+    'Joomla': ['joomla', '/administrator/', 'mosConfig'],
+    'Ghost': ['ghost.io', 'ghost-theme', 'ghost-foot'],
+    'Medium': ['medium.com', 'cdn-client.medium.com'],
+    'HubSpot': ['hubspot', 'hs-scripts', 'hstc.'],
+    'Magento': ['magento', 'mage/', '/skin/frontend/'],
+    'PrestaShop': ['prestashop', '/modules/'],
+    'OpenCart': ['opencart', 'route=product'],
+    'BigCommerce': ['bigcommerce', '.mybigcommerce.com'],
+    'Salesforce Commerce': ['demandware.', 'commerce-cloud']
+}
+
+FRAMEWORK_PATTERNS = {
+    'react': ['react.js', 'reactjs', 'react-dom'],
+    'angular': ['ng-', 'angular.js', 'angular/'],
+    'vue': ['vue.js', 'vuejs'],
+    'bootstrap': ['bootstrap.css', 'bootstrap.min.css'],
+    'jquery': ['jquery.js', 'jquery.min.js'],
+    'next.js': ['__next', '_next/static'],
+    'gatsby': ['gatsby-', '/page-data/'],
+    'tailwind': ['tailwind.css', 'tailwindcss']
+}
+
+HOSTING_PATTERNS = {
+    'Netlify': ['netlify.app', 'netlify.com'],
+    'Vercel': ['vercel.app', 'vercel.com'],
+    'GitHub Pages': ['github.io'],
+    'AWS': ['amazonaws.com'],
+    'Heroku': ['herokuapp.com'],
+    'Firebase': ['firebaseapp.com'],
+    'Azure': ['azurewebsites.net'],
+    'DigitalOcean': ['digitaloceanspaces.com'],
+}
+
+TECHNOLOGY_PATTERNS = {
+    'Google Analytics': ['ga.js', 'analytics.js', 'gtag'],
+    'Google Tag Manager': ['gtm.js'],
+    'Facebook Pixel': ['connect.facebook.net'],
+    'Cloudflare': ['cloudflare'],
+    'reCAPTCHA': ['recaptcha'],
+    'Font Awesome': ['font-awesome'],
+    'Google Fonts': ['fonts.googleapis.com'],
+}
+
+def _build_platform_automaton(tables: Tuple[Tuple[str, Dict[str, List[str]]], ...]) -> ahocorasick.Automaton:
+    """Builds one Aho-Corasick automaton over the given signature tables, tagged with (category, label)."""
+    tagged: Dict[str, List[Tuple[str, str]]] = {}
+    for category, table in tables:
+        for label, patterns in table.items():
+            for pattern in patterns:
+                tagged.setdefault(pattern, []).append((category, label))
+
+    automaton = ahocorasick.Automaton()
+    for pattern, tags in tagged.items():
+        automaton.add_word(pattern, tags)
+    automaton.make_automaton()
+    return automaton
+
+PLATFORM_AUTOMATON = _build_platform_automaton((
+    ('cms', CMS_PATTERNS), ('framework', FRAMEWORK_PATTERNS),
+    ('hosting', HOSTING_PATTERNS), ('technology', TECHNOLOGY_PATTERNS),
+))
+
+# CMS/hosting-only automaton for fast mode, which skips framework and technology detection
+CMS_AUTOMATON = _build_platform_automaton((('cms', CMS_PATTERNS), ('hosting', HOSTING_PATTERNS)))
+
+def _match_platform_patterns(text: str, categories: Tuple[str, ...],
+                             automaton: ahocorasick.Automaton = PLATFORM_AUTOMATON) -> Dict[str, set]:
+    """Scans text once and returns the matched labels per category."""
+    hits = {category: set() for category in categories}
+    for _, tags in automaton.iter(text):
+        for category, label in tags:
+            if category in hits:
+                hits[category].add(label)
+    return hits
+
+def extract_generator(tree: LexborHTMLParser) -> Optional[str]:
+    """Returns the <meta name="generator"> content (e.g. "WordPress 6.7"), if present."""
+    meta_generator = tree.css_first('meta[name="generator"]')
+    return meta_generator.attributes.get('content') if meta_generator else None
+
+def detect_platform(html_lower: str, url: str, generator: Optional[str] = None, fast: bool = False) -> Dict[str, Any]:
     """
     Detects the CMS platform, hosting service, and other technologies used by the website.
+    `html_lower` must already be lowercased; `generator` is the page's
+    <meta name="generator"> content, if any.
+    With fast=True only the CMS and hosting are detected.
     """
     platform_data = {
         "cms": "Unknown",
@@ -61,98 +294,47 @@ def detect_platform(soup: BeautifulSoup, html_content: str, url: str) -> Dict[st
         "cdn": "Unknown"
     }
     
-    # Convert HTML content to lowercase for case-insensitive matching
-    html_lower = html_content.lower()
+    # A single pass over the HTML matches every CMS/framework/technology signature
+    automaton = CMS_AUTOMATON if fast else PLATFORM_AUTOMATON
+    hits = _match_platform_patterns(html_lower, ('cms', 'framework', 'technology'), automaton)
     
-    # CMS Detection with version if available
-    cms_patterns = {
-        'WordPress': ['wp-content', 'wp-includes', 'wordpress'],
-        'Shopify': ['shopify', '.myshopify.com'],
-        'Wix': ['wix-viewer', 'wixsite.com', '_wixCss', '_wixJs'],
-        'Squarespace': ['squarespace', 'static1.squarespace'],
-        'Webflow': ['webflow', '.webflow.com', 'webflow.js'],
-        'Drupal': ['drupal', 'sites/all', 'drupal.js'],
-        'Joomla': ['joomla', '/administrator/', 'mosConfig'],
-        'Ghost': ['ghost.io', 'ghost-theme', 'ghost-foot'],
-        'Medium': ['medium.com', 'cdn-client.medium.com'],
-        'HubSpot': ['hubspot', 'hs-scripts', 'hstc.'],
-        'Magento': ['magento', 'mage/', '/skin/frontend/'],
-        'PrestaShop': ['prestashop', '/modules/'],
-        'OpenCart': ['opencart', 'route=product'],
-        'BigCommerce': ['bigcommerce', '.mybigcommerce.com'],
-        'Salesforce Commerce': ['demandware.', 'commerce-cloud']
-    }
-    # Detect CMS by checking patterns; require at least one pattern match
-    for cms_name, patterns in cms_patterns.items():
-        if any(p in html_lower for p in patterns):
+    # CMS Detection: first match in priority order wins
+    for cms_name in CMS_PATTERNS:
+        if cms_name in hits['cms']:
             platform_data["cms"] = cms_name
             break
     
-    # Framework detection
-    frameworks = {
-        'react': ['react.js', 'reactjs', 'react-dom'],
-        'angular': ['ng-', 'angular.js', 'angular/'],
-        'vue': ['vue.js', 'vuejs'],
-        'bootstrap': ['bootstrap.css', 'bootstrap.min.css'],
-        'jquery': ['jquery.js', 'jquery.min.js'],
-        'next.js': ['__next', '_next/static'],
-        'gatsby': ['gatsby-', '/page-data/'],
-        'tailwind': ['tailwind.css', 'tailwindcss']
-    }
+    # Hosting detection (based on the URL, not the page body)
+    hosting_hits = _match_platform_patterns(url.lower(), ('hosting',), automaton)['hosting']
+    for host in HOSTING_PATTERNS:
+        if host in hosting_hits:
+            platform_data["hosting"] = host
+            break
     
-    detected_frameworks = []
-    for framework, indicators in frameworks.items():
-        if any(indicator in html_lower for indicator in indicators):
-            detected_frameworks.append(framework)
+    if fast:
+        return platform_data
     
+    # Framework detection
+    detected_frameworks = [name for name in FRAMEWORK_PATTERNS if name in hits['framework']]
     if detected_frameworks:
         platform_data["framework"] = ", ".join(detected_frameworks)
     
-    # Hosting detection
-    hosting_indicators = {
-        'Netlify': ['netlify.app', 'netlify.com'],
-        'Vercel': ['vercel.app', 'vercel.com'],
-        'GitHub Pages': ['github.io'],
-        'AWS': ['amazonaws.com'],
-        'Heroku': ['herokuapp.com'],
-        'Firebase': ['firebaseapp.com'],
-        'Azure': ['azurewebsites.net'],
-        'DigitalOcean': ['digitaloceanspaces.com'],
-    }
-    
-    for host, indicators in hosting_indicators.items():
-        if any(indicator in url.lower() for indicator in indicators):
-            platform_data["hosting"] = host
-            break
-    
     # Technology detection
-    meta_generator = soup.find('meta', attrs={'name': 'generator'})
-    if meta_generator and meta_generator.get('content'):
-        platform_data["technologies"].append(meta_generator['content'])
+    if generator:
+        platform_data["technologies"].append(generator)
     
     # Additional technology detection
-    common_technologies = {
-        'Google Analytics': ['ga.js', 'analytics.js', 'gtag'],
-        'Google Tag Manager': ['gtm.js'],
-        'Facebook Pixel': ['connect.facebook.net'],
-        'Cloudflare': ['cloudflare'],
-        'reCAPTCHA': ['recaptcha'],
-        'Font Awesome': ['font-awesome'],
-        'Google Fonts': ['fonts.googleapis.com'],
-    }
-    
-    for tech, indicators in common_technologies.items():
-        if any(indicator in html_lower for indicator in indicators):
-            platform_data["technologies"].append(tech)
+    platform_data["technologies"].extend(tech for tech in TECHNOLOGY_PATTERNS if tech in hits['technology'])
     
     return platform_data
 
-def analyze_content_context(text: str, title: str, description: str) -> Dict[str, List[str]]:
+def analyze_content_context(text_lower: str, title_lower: str, description_lower: str) -> Dict[str, List[str]]:
     """
     Analyzes the content to identify business context, main topics, and target audience.
+    All arguments are expected to be lowercased already.
     """
     # Combine all text for analysis
-    all_text = f"{title} {description} {text}".lower()
+    all_text = f"{title_lower} {description_lower} {text_lower}"
     
     # Common business category indicators
     business_indicators = {
@@ -177,47 +359,28 @@ def analyze_content_context(text: str, title: str, description: str) -> Dict[str
     
     # Extract potential service offerings based on category
     services = []
-    words = all_text.split()
-    word_pairs = [f"{words[i]} {words[i+1]}" for i in range(len(words)-1)]
-    
-    # Look for service-related phrases
-    service_indicators = [
-        r'we (offer|provide|deliver|specialize in)',
-        r'our (services|solutions|products|expertise)',
-        r'specialized in',
-        r'expert in',
-        r'consulting for'
-    ]
     
-    for pattern in service_indicators:
-        matches = re.finditer(pattern, all_text)
-        for match in matches:
-            # Get the text after the match
-            start = match.end()
-            end = start + 100  # Look at next 100 characters
-            service_text = all_text[start:end].split('.')[0]  # Get first sentence
-            if service_text:
-                services.append(service_text.strip())
+    # Look for service-related phrases in one scan; ordering by the matched
+    # alternative keeps the results grouped per phrase as before
+    matches = sorted(_SERVICE_RE.finditer(all_text), key=lambda m: m.lastindex)
+    for match in matches:
+        # Get the text after the match
+        start = match.end()
+        end = start + 100  # Look at next 100 characters
+        service_text = all_text[start:end].split('.', 1)[0]  # Get first sentence
+        if service_text:
+            services.append(service_text.strip())
     
     # Identify main topics
     # Remove common words and get word frequency
     common_words = {'the', 'and', 'or', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-    words = [w for w in re.findall(r'\w+', all_text) if w not in common_words and len(w) > 3]
-    word_freq = Counter(words).most_common(10)
+    word_freq = Counter(
+        m.group() for m in _WORD_RE.finditer(all_text) if m.group() not in common_words
+    ).most_common(10)
     main_topics = [word for word, _ in word_freq]
     
     # Detect target audience
-    audience_indicators = {
-        'businesses': ['business', 'company', 'corporate', 'enterprise', 'organization'],
-        'consumers': ['individual', 'personal', 'consumer', 'customer', 'user'],
-        'professionals': ['professional', 'expert', 'specialist', 'practitioner'],
-        'students': ['student', 'learner', 'education', 'academic'],
-    }
-    
-    audience = []
-    for audience_type, indicators in audience_indicators.items():
-        if any(indicator in all_text for indicator in indicators):
-            audience.append(audience_type)
+    audience = [audience_type for audience_type, pattern in _AUDIENCE_RES.items() if pattern.search(all_text)]
     
     return {
         "main_topics": main_topics,
@@ -226,11 +389,12 @@ def analyze_content_context(text: str, title: str, description: str) -> Dict[str
         "business_category": main_category
     }
 
-def crawl_website_data(url: str, fast: bool = False, cache_ttl: int = 300) -> dict:
+async def crawl_website_data(session: aiohttp.ClientSession, url: str, fast: bool = False, cache_ttl: int = 300) -> dict:
     """
     Crawls a URL to extract SEO data and calculate SEO scores.
 
     Parameters:
+      - session: shared aiohttp session used to fetch the page
       - url: website to crawl
       - fast: when True, performs a lightweight, faster analysis (shorter timeouts, limited parsing)
       - cache_ttl: seconds to cache the result (0 to disable caching)
@@ -238,90 +402,124 @@ def crawl_website_data(url: str, fast: bool = False, cache_ttl: int = 300) -> di
     try:
         # Check cache first
         if cache_ttl > 0 and not fast:
-            cached = _load_cache(url, cache_ttl)
+            cached = _load_cache(url)
             if cached:
                 cached['_from_cache'] = True
                 return cached
 
-        # Record start time for actual load time calculation
-        start_time = time.time()
         timeout = 6 if fast else 10
-        response = SESSION.get(url, timeout=timeout)
-        response.raise_for_status()
-
-        # Calculate actual load time
-        load_time = time.time() - start_time
-
-        content = response.content
-        if fast and len(content) > 200_000:
-            content = content[:200_000]
+        max_bytes = FAST_MAX_BYTES if fast else MAX_BYTES
+        parsed_url = urlparse(url)
+        domain = parsed_url.netloc
 
-        soup = BeautifulSoup(content, 'html.parser')
+        # Fetch the page while robots.txt / sitemap.xml are probed, so the
+        # audit waits for the slowest request rather than the sum of all three
+        # (the probes are skipped in fast mode)
+        if fast:
+            page_result = await _timed_fetch(session, url, timeout, max_bytes)
+            robots_txt_status = sitemap_status = PROBE_SKIPPED
+        else:
+            origin = f"{parsed_url.scheme}://{parsed_url.netloc}"
+            page_result, robots_txt_status, sitemap_status = await asyncio.gather(
+                _timed_fetch(session, url, timeout, max_bytes),
+                _probe(session, f"{origin}/robots.txt", timeout),
+                _probe(session, f"{origin}/sitemap.xml", timeout),
+                return_exceptions=True,
+            )
+            if isinstance(page_result, BaseException):
+                raise page_result
+            # A probe that failed in some unexpected way is just an unknown status, not a failed audit
+            robots_txt_status = robots_txt_status if isinstance(robots_txt_status, str) else PROBE_FAILED
+            sitemap_status = sitemap_status if isinstance(sitemap_status, str) else PROBE_FAILED
+        content, encoding, load_time = page_result
+
+        # Content address for the in-process analysis caches
+        content_hash = hashlib.blake2b(content, digest_size=16).digest()
+
+        tree = LexborHTMLParser(content)
 
         # Enhanced SEO data extraction (lightweight where possible)
-        title_tag = soup.find('title')
-        title = title_tag.text.strip() if title_tag else "N/A"
+        title_tag = tree.css_first('title')
+        title = title_tag.text().strip() if title_tag else "N/A"
 
         # Meta tags analysis
-        meta_description = soup.find('meta', attrs={'name': 'description'})
+        meta_description = tree.css_first('meta[name="description"]')
         if not meta_description:
-            meta_description = soup.find('meta', attrs={'property': 'og:description'})
-        description = meta_description['content'].strip() if meta_description and meta_description.get('content') else "N/A"
+            meta_description = tree.css_first('meta[property="og:description"]')
+        description_content = meta_description.attributes.get('content') if meta_description else None
+        description = description_content.strip() if description_content else "N/A"
 
-        meta_robots = soup.find('meta', attrs={'name': 'robots'})
-        robots_content = meta_robots['content'] if meta_robots else "index, follow"
+        meta_robots = tree.css_first('meta[name="robots"]')
+        robots_content = (meta_robots.attributes.get('content') or "index, follow") if meta_robots else "index, follow"
 
         # Headings analysis (limit counts to reduce parsing time)
-        headings = {
-            'h1': [h.text.strip() for h in soup.find_all('h1')[:2]],
-            'h2': [h.text.strip() for h in soup.find_all('h2')[:5]],
-            'h3': [h.text.strip() for h in soup.find_all('h3')[:5]]
-        }
+        # One selector pass fills all three buckets instead of three separate scans
+        heading_limits = {'h1': 2, 'h2': 5, 'h3': 5}
+        headings = {'h1': [], 'h2': [], 'h3': []}
+        for h in tree.css('h1, h2, h3'):
+            bucket = headings[h.tag]
+            if len(bucket) < heading_limits[h.tag]:
+                bucket.append(h.text().strip())
 
         # Link analysis
-        links = soup.find_all('a', href=True)
-        parsed_url = urlparse(url)
-        domain = parsed_url.netloc
-
-        internal_links = [l for l in links if domain in l.get('href', '') or l.get('href', '').startswith('/')]
-        external_links = [l for l in links if l not in internal_links]
+        links = tree.css('a[href]')
+        domain_lower = domain.lower()
+        # Classify links and pick out service/product pages in one pass
+        # (service page scanning is skipped in fast mode)
+        internal_links, external_links, service_pages = [], [], []
+        for link in links:
+            href_lower = (link.attributes.get('href') or '').lower()
+            is_internal = href_lower.startswith('/') or domain_lower in href_lower
+            (internal_links if is_internal else external_links).append(link)
+            if is_internal and not fast:
+                link_text = link.text().strip()
+                text = link_text.lower()
+                if any(term in href_lower or term in text for term in _SERVICE_TERMS):
+                    service_pages.append({
+                        'url': href_lower,
+                        'text': link_text
+                    })
 
         # Images analysis (limit search in fast mode)
-        images = soup.find_all('img') if not fast else soup.find_all('img')[:40]
-        images_without_alt = [img for img in images if not img.get('alt')]
+        images = tree.css('img') if not fast else tree.css('img')[:40]
+        images_without_alt = [img for img in images if not img.attributes.get('alt')]
 
         # Structured data detection
-        structured_data = bool(soup.find_all('script', {'type': 'application/ld+json'}))
+        structured_data = tree.css_first('script[type="application/ld+json"]') is not None
 
         # Mobile viewport check
-        has_viewport = bool(soup.find('meta', attrs={'name': 'viewport'}))
+        has_viewport = tree.css_first('meta[name="viewport"]') is not None
+
+        # Detect platform and technologies from the raw markup
+        generator = extract_generator(tree)
+        # Lowercase the page once here rather than in each consumer
+        html_lower = content.decode(encoding, errors='ignore').lower()
+        platform_info = _lru_lookup(
+            _PLATFORM_CACHE, (content_hash, url, fast),
+            lambda: detect_platform(html_lower, url, generator, fast=fast)
+        )
+
+        # selectolax includes script/style bodies in text(), so drop them before extracting copy
+        tree.strip_tags(['script', 'style', 'noscript'])
 
         # Extract main text content; prefer <main> or <article> where available
-        main_candidate = soup.find('main') or soup.find('article') or soup.find('body')
+        main_candidate = tree.css_first('main') or tree.css_first('article') or tree.body
         if main_candidate:
-            text_content = main_candidate.get_text(separator=' ', strip=True)
+            text_content = _bounded_text(main_candidate)
         else:
-            text_content = ' '.join([p.text for p in soup.find_all(['p', 'li', 'h1', 'h2', 'h3'])])
+            text_content = ' '.join([p.text() for p in tree.css('p, li, h1, h2, h3')])
         if fast:
             text_content = text_content[:1000]
 
-        # Extract service/product pages (skip heavy link scanning in fast mode)
-        service_pages = []
-        if not fast:
-            for link in internal_links:
-                href = link.get('href', '').lower()
-                text = link.text.strip().lower()
-                if any(term in href or term in text for term in ['service', 'product', 'solution', 'consulting', 'about']):
-                    service_pages.append({
-                        'url': href,
-                        'text': link.text.strip()
-                    })
-
         # Analyze main topics and industry terms
-        content_analysis = analyze_content_context(text_content, title, description)
-
-        # Detect platform and technologies
-        platform_info = detect_platform(soup, str(soup), url)
+        # Fast mode skips the regex/word-frequency passes entirely
+        if fast:
+            content_analysis = {"main_topics": [], "services": [], "audience": [], "business_category": "Unknown"}
+        else:
+            content_analysis = _lru_lookup(
+                _CONTENT_CACHE, (content_hash,),
+                lambda: analyze_content_context(text_content.lower(), title.lower(), description.lower())
+            )
 
         # Collect crawled data
         crawled_data = {
@@ -347,10 +545,9 @@ def crawl_website_data(url: str, fast: bool = False, cache_ttl: int = 300) -> di
                 "page_load_time_s": round(load_time, 2),
                 "mobile_friendly": "Yes" if has_viewport else "No",
                 "structured_data_present": "Yes" if structured_data else "No (Missing)",
-                "robots_txt_status": "Found"  # This would need actual checking in production
-            },
-            # Avoid storing huge raw HTML in fast mode
-            "raw_html": (str(soup) if not fast else None)
+                "robots_txt_status": robots_txt_status,
+                "sitemap_status": sitemap_status
+            }
         }
 
         # Calculate SEO scores
@@ -367,11 +564,11 @@ def crawl_website_data(url: str, fast: bool = False, cache_ttl: int = 300) -> di
         # Save to cache for faster subsequent runs (skip caching in fast mode)
         if cache_ttl > 0 and not fast:
             try:
-                _save_cache(url, crawled_data)
+                _save_cache(url, crawled_data, cache_ttl)
             except Exception:
                 pass
 
         return crawled_data
 
-    except requests.exceptions.RequestException as e:
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         return {"error": f"Error crawling website: {e}"}
\ No newline at end of file
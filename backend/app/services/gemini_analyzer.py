@@ -1,14 +1,33 @@
 # backend/app/services/gemini_analyzer.py
 
 import os
+import hashlib
 from google import genai
 from google.genai.errors import APIError
+from . import cache_store
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+    _json_dumps_sorted = lambda obj: orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    import json
+    _json_loads = json.loads
+    _json_dumps = lambda obj: json.dumps(obj).encode('utf-8')
+    _json_dumps_sorted = lambda obj: json.dumps(obj, sort_keys=True).encode('utf-8')
 
 # --- Initialization ---
 # The client automatically uses the GEMINI_API_KEY from the .env file
 client = genai.Client()
 MODEL = "gemini-2.5-flash" 
 
+# Seconds to reuse a Gemini response for an identical prompt payload (default 24h)
+GEMINI_CACHE_TTL = int(os.environ.get("GEMINI_CACHE_TTL", 24 * 60 * 60))
+
+# Cap on service/product page links included in the prompt, to bound input tokens
+MAX_PROMPT_SERVICE_PAGES = 20
+
 # --- System Instruction: The AI SEO Expert Persona ---
 SEO_EXPERT_SYSTEM_PROMPT = """
 You are an expert SEO and marketing intelligence system, specializing in on-page and technical SEO analysis. 
@@ -39,7 +58,7 @@ Response JSON Format:
     ...
   ],
   "technical_seo_evaluation": {
-    "site_speed": "<Evaluation based on simulated_metrics>",
+    "site_speed": "<Evaluation based on metrics>",
     "mobile_usability": "<Evaluation>",
     "structured_data": "<Evaluation and suggestion to implement>",
   },
@@ -47,40 +66,73 @@ Response JSON Format:
 }
 """
 
-def analyze_with_gemini(crawled_data: dict) -> dict:
+# Instruction line placed before the JSON site data in the user prompt
+USER_PROMPT_PREFIX = (
+    "Perform a full SEO audit on the following website data (JSON). Pay special attention to "
+    "identifying the correct business category and relevant keywords based on the actual content:\n"
+)
+
+# Fingerprint of the prompt text; part of the cache key so prompt edits invalidate stored responses
+_PROMPT_DIGEST = hashlib.blake2b(
+    (SEO_EXPERT_SYSTEM_PROMPT + USER_PROMPT_PREFIX).encode('utf-8'), digest_size=16
+).hexdigest()
+
+def _build_prompt_payload(crawled_data: dict) -> dict:
+    """Collects exactly the crawled fields that are sent to the model in the user prompt."""
+    elements = dict(crawled_data.get('on_page_elements', {}))
+    elements['service_pages'] = elements.get('service_pages', [])[:MAX_PROMPT_SERVICE_PAGES]
+    return {
+        "url": crawled_data.get('url'),
+        "domain": crawled_data.get('domain'),
+        "head": crawled_data.get('html_head_data', {}),
+        "elements": elements,
+        "content": crawled_data.get('content_analysis', {}),
+        "metrics": crawled_data.get('simulated_metrics'),
+        "text": crawled_data.get('extracted_text', '')[:1000],
+    }
+
+def _load_time_bucket(seconds) -> str:
+    """Buckets a load time at the same 2s/3s thresholds SEOScorer penalizes."""
+    try:
+        seconds = float(seconds)
+    except (TypeError, ValueError):
+        return "unknown"
+    return "fast" if seconds <= 2 else ("ok" if seconds <= 3 else "slow")
+
+def _payload_cache_key(payload: dict) -> str:
+    """
+    Content-addresses a prompt payload so identical audits share a cached response.
+    The load time is re-measured on every crawl, so the key uses its bucket instead of the raw value.
+    The model and prompt text are hashed in too, so changing either invalidates cached responses.
+    """
+    metrics = dict(payload.get('metrics') or {})
+    if 'page_load_time_s' in metrics:
+        metrics['page_load_time_s'] = _load_time_bucket(metrics['page_load_time_s'])
+    normalized = {**payload, 'metrics': metrics, '_model': MODEL, '_prompt': _PROMPT_DIGEST}
+    return hashlib.blake2b(_json_dumps_sorted(normalized), digest_size=16).hexdigest()
+
+async def analyze_with_gemini(crawled_data: dict) -> dict:
     """
     Sends crawled data to Gemini for expert SEO analysis and structured output.
+    Responses are cached for GEMINI_CACHE_TTL seconds, keyed by the prompt payload.
     """
     if "error" in crawled_data:
         return {"error": crawled_data["error"]}
 
-    # Convert the raw data into a clear prompt for the model
-    user_prompt = f"""
-    Perform a full SEO audit on the following raw website data. Pay special attention to identifying the correct business category and relevant keywords based on the actual content:
-    
-    Target URL: {crawled_data.get('url')}
-    Domain: {crawled_data.get('domain')}
-    
-    HTML Head Data:
-    - Title: {crawled_data.get('html_head_data', {}).get('title')}
-    - Meta Description: {crawled_data.get('html_head_data', {}).get('meta_description')}
-    
-    Content Analysis:
-    - Main Headings: {crawled_data.get('on_page_elements', {}).get('headings', {})}
-    - Main Text Content: {crawled_data.get('extracted_text', '')}
-    - Service/Product Pages: {crawled_data.get('on_page_elements', {}).get('service_pages', [])}
-    - Industry Terms: {crawled_data.get('on_page_elements', {}).get('industry_terms', [])}
-    
-    Business Context:
-    - Primary Topics: {crawled_data.get('content_analysis', {}).get('main_topics', [])}
-    - Service Offerings: {crawled_data.get('content_analysis', {}).get('services', [])}
-    - Target Audience: {crawled_data.get('content_analysis', {}).get('audience', [])}
-    
-    Technical Metrics: {crawled_data.get('simulated_metrics')}
-    """
+    payload = _build_prompt_payload(crawled_data)
+    cache_key = _payload_cache_key(payload)
+    try:
+        cached = cache_store.get_blob('gemini_cache', cache_key)
+        if cached:
+            return _json_loads(cached)
+    except Exception:
+        pass
+
+    # Send the site data as compact JSON rather than repr()-formatted dicts
+    user_prompt = USER_PROMPT_PREFIX + _json_dumps(payload).decode('utf-8')
 
     try:
-        response = client.models.generate_content(
+        response = await client.aio.models.generate_content(
             model=MODEL,
             contents=user_prompt,
             config=genai.types.GenerateContentConfig(
@@ -89,10 +141,14 @@ def analyze_with_gemini(crawled_data: dict) -> dict:
             )
         )
         # The response.text is a JSON string due to response_mime_type="application/json"
-        import json
-        return json.loads(response.text)
+        report = _json_loads(response.text)
+        try:
+            cache_store.put_blob('gemini_cache', cache_key, response.text.encode('utf-8'), GEMINI_CACHE_TTL)
+        except Exception:
+            pass
+        return report
 
     except APIError as e:
         return {"error": f"Gemini API Error: {e}"}
     except Exception as e:
-        return {"error": f"Analysis failed: {e}"}
\ No newline at end of file
+        return {"error": f"Analysis failed: {e}"}
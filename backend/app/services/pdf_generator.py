@@ -1,27 +1,86 @@
 # backend/app/services/pdf_generator.py
 
+import hashlib
+import json
+import threading
+from collections import OrderedDict
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 from io import BytesIO
 
+# --- Shared Styles (built once per process, never mutated per report) ---
+_STYLES = getSampleStyleSheet()
+# The sample sheet already defines Heading2/Normal (add() raises on duplicates), so apply
+# the report's sizes to those styles in place; the sheet is private to this module
+if 'TitleStyle' not in _STYLES:
+    _STYLES.add(ParagraphStyle(name='TitleStyle', fontSize=24, spaceAfter=20, alignment=1, fontName='Helvetica-Bold'))
+_heading2 = _STYLES['Heading2']
+_heading2.fontSize, _heading2.spaceBefore, _heading2.spaceAfter = 16, 12, 6
+_heading2.fontName, _heading2.leftIndent = 'Helvetica-Bold', 0
+_STYLES['Normal'].fontSize, _STYLES['Normal'].spaceAfter = 10, 6
+
+_ISSUE_TABLE_CMDS = [
+    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue), # Header Background
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke), # Header Text
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('FONTSIZE', (0, 1), (-1, -1), 8),
+    # The priority column is colored/bolded per row in generate_seo_pdf
+]
+
+# Priority cell background; anything unrecognized is treated as Low
+_PRIORITY_COLOR = {'High': colors.lightcoral, 'Medium': colors.yellow, 'Low': colors.lightgreen}
+
+_TECH_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+])
+
+# --- Rendered PDF cache (re-downloads of the same report skip ReportLab entirely) ---
+PDF_CACHE_SIZE = 64
+_PDF_CACHE: "OrderedDict[bytes, bytes]" = OrderedDict()
+_PDF_CACHE_LOCK = threading.Lock() # /download is a sync endpoint, so renders run on worker threads
+
+def _report_key(report_data: dict) -> bytes:
+    """Stable digest of the report contents (key order doesn't matter)."""
+    dumped = json.dumps(report_data, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(dumped, digest_size=16).digest()
+
 def generate_seo_pdf(report_data: dict) -> bytes:
     """
     Generates a professional PDF report from the Gemini SEO analysis JSON.
-    Returns the PDF content as bytes.
+    Returns the PDF content as bytes, served from the cache when the same report
+    was rendered recently.
     """
+    key = _report_key(report_data)
+    with _PDF_CACHE_LOCK:
+        pdf = _PDF_CACHE.get(key)
+        if pdf is not None:
+            _PDF_CACHE.move_to_end(key)
+
+    if pdf is None:
+        pdf = _build_pdf(report_data)
+        with _PDF_CACHE_LOCK:
+            _PDF_CACHE[key] = pdf
+            if len(_PDF_CACHE) > PDF_CACHE_SIZE:
+                _PDF_CACHE.popitem(last=False)
+    return pdf
+
+def _build_pdf(report_data: dict) -> bytes:
+    """Renders the report with ReportLab and returns the PDF content."""
     # Use BytesIO to create an in-memory file for the PDF
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter, 
                             leftMargin=72, rightMargin=72, topMargin=72, bottomMargin=72)
-    styles = getSampleStyleSheet()
+    styles = _STYLES
     Story = []
-
-    # --- Custom Styles ---
-    styles.add(ParagraphStyle(name='TitleStyle', fontSize=24, spaceAfter=20, alignment=1, fontName='Helvetica-Bold'))
-    styles.add(ParagraphStyle(name='Heading2', fontSize=16, spaceBefore=12, spaceAfter=6, fontName='Helvetica-Bold', leftIndent=0))
-    styles.add(ParagraphStyle(name='Normal', fontSize=10, spaceAfter=6))
     
     # --- 1. Report Header ---
     Story.append(Paragraph("AI-Powered SEO Audit Report", styles['TitleStyle']))
@@ -37,33 +96,26 @@ def generate_seo_pdf(report_data: dict) -> bytes:
     
     # Define table structure (Header row + data)
     table_data = [['Category', 'Issue', 'Priority', 'Recommended Action']]
+    # Priority cells are plain strings styled by TableStyle commands, not a Paragraph per row
+    priority_cmds = []
     
-    for issue in report_data.get('issues_found', []):
-        row_color = colors.lightcoral if issue['priority'] == 'High' else (colors.yellow if issue['priority'] == 'Medium' else colors.lightgreen)
+    for row, issue in enumerate(report_data.get('issues_found', []), start=1):
+        priority = issue['priority']
         table_data.append([
             issue['category'], 
             issue['issue'], 
-            Paragraph(f"<b>{issue['priority']}</b>", styles['Normal']), 
+            priority, 
             issue['recommended_action']
         ])
+        priority_cmds.append(('BACKGROUND', (2, row), (2, row), _PRIORITY_COLOR.get(priority, colors.lightgreen)))
+        priority_cmds.append(('FONTNAME', (2, row), (2, row), 'Helvetica-Bold'))
 
     # Create the Table object
     col_widths = [70, 120, 50, 200]
     issue_table = Table(table_data, colWidths=col_widths)
     
     # Apply Table Style
-    issue_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue), # Header Background
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke), # Header Text
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-        # Color the priority column based on data (requires separate logic if done fully dynamically)
-        # For simplicity, we bolded the text above.
-    ]))
+    issue_table.setStyle(TableStyle(_ISSUE_TABLE_CMDS + priority_cmds))
     
     Story.append(issue_table)
     Story.append(Spacer(0, 20))
@@ -80,12 +132,7 @@ def generate_seo_pdf(report_data: dict) -> bytes:
     ]
     
     tech_table = Table(tech_data, colWidths=[120, 320])
-    tech_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-    ]))
+    tech_table.setStyle(_TECH_TABLE_STYLE)
     
     Story.append(tech_table)
     Story.append(Spacer(0, 12))
@@ -101,8 +148,6 @@ def generate_seo_pdf(report_data: dict) -> bytes:
     # --- Build the PDF document ---
     doc.build(Story)
     
-    # Get the value of the BytesIO buffer (the PDF content)
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
-    
-    return pdf_bytes
\ No newline at end of file
+    # Get the value of the BytesIO buffer (the PDF content); getvalue() hands back
+    # the buffer's own bytes object when it can instead of copying it
+    return buffer.getvalue()
\ No newline at end of file
@@ -1,15 +1,23 @@
 # C:\Users\Vinay bm\OneDrive\Desktop\ai-seo-auditor\backend\app\services\platform_test.py
 
+import asyncio
+import httpx
 import requests
-from bs4 import BeautifulSoup
-from .crawler import detect_platform # Import from crawler.py within the same directory/package
-from typing import Dict, Any # For type hinting
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
+from .crawler import detect_platform, extract_generator, _text_encoding # Import from crawler.py within the same directory/package
+from typing import Dict, Any, Optional # For type hinting
 
 # Define a requests session with a user agent (important for some sites)
 SESSION = requests.Session()
 SESSION.headers.update({
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 })
+# Size the connection pool and retry transient failures
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=Retry(total=2, backoff_factor=0.3))
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
 
 def print_results(url: str, results: Dict[str, Any]) -> None:
     """Helper function to print the detected platform information."""
@@ -30,6 +38,38 @@ def print_results(url: str, results: Dict[str, Any]) -> None:
         print("\nNo specific technologies detected.")
     print("-" * 50)
 
+def detect_from_response(raw: bytes, encoding: Optional[str], url: str) -> Dict[str, Any]:
+    """Parses a fetched page and runs platform detection on it.
+
+    The body is read once as bytes: Lexbor parses the bytes directly and the text is decoded
+    a single time for detect_platform (instead of also going through response.text).
+    The server-declared charset goes through the crawler's check, falling back to utf-8.
+    """
+    tree = LexborHTMLParser(raw)
+    html_lower = raw.decode(_text_encoding(encoding), errors='replace').lower() # detect_platform expects lowercased HTML
+    # Pass the lowercased HTML, the URL, and the generator meta tag
+    return detect_platform(html_lower, url, extract_generator(tree))
+
+def probe(url: str) -> Dict[str, Any]:
+    """Blocking probe over the shared requests SESSION (for simple synchronous use)."""
+    response = SESSION.get(url, timeout=15) # Increased timeout
+    response.raise_for_status() # Raise an exception for bad status codes (4xx or 5xx)
+    return detect_from_response(response.content, response.encoding, url)
+
+async def probe_async(client: httpx.AsyncClient, url: str) -> Dict[str, Any]:
+    """Non-blocking probe; many of these can share one pooled (HTTP/2) client concurrently."""
+    response = await client.get(url)
+    response.raise_for_status()
+    return detect_from_response(response.content, response.charset_encoding, url)
+
+def async_client() -> httpx.AsyncClient:
+    """HTTP/2 client with the same headers as SESSION; one connection multiplexes parallel probes per host."""
+    return httpx.AsyncClient(http2=True, headers=dict(SESSION.headers), timeout=15, follow_redirects=True)
+
+async def main(url: str) -> Dict[str, Any]:
+    async with async_client() as client:
+        return await probe_async(client, url)
+
 # --- Main script execution ---
 if __name__ == "__main__":
     url_to_test = input("Enter the website URL to test (e.g., https://example.com): ").strip()
@@ -39,22 +79,13 @@ if __name__ == "__main__":
     else:
         print(f"\nTesting URL: {url_to_test}")
         try:
-            # --- Make the HTTP request ---
-            response = SESSION.get(url_to_test, timeout=15) # Increased timeout
-            response.raise_for_status() # Raise an exception for bad status codes (4xx or 5xx)
-            
-            # --- Parse the HTML ---
-            soup = BeautifulSoup(response.content, 'html.parser')
-            html_content = response.text # Use the decoded text content for analysis
-
-            # --- Call the detection function ---
-            # Pass the soup object, the raw HTML text, and the URL
-            platform_results = detect_platform(soup, html_content, url_to_test) 
+            # --- Fetch, parse and detect ---
+            platform_results = asyncio.run(main(url_to_test))
             
             # --- Print the results ---
             print_results(url_to_test, platform_results)
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             print(f"Error fetching URL {url_to_test}: {e}")
         except Exception as e:
             # Catch any other unexpected errors during parsing or detection
@@ -3,11 +3,49 @@ SEO Scoring Algorithm Module
 This module calculates a comprehensive SEO score based on various factors and best practices.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union, TYPE_CHECKING
 import re
-from bs4 import BeautifulSoup
 from urllib.parse import urlparse
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Optional compiled checks (see seo_scorer_fast.pyx); the pure-Python methods below are the fallback
+try:
+    from .seo_scorer_fast import analyze_title_c, analyze_meta_description_c, analyze_url_structure_c
+except ImportError:
+    analyze_title_c = analyze_meta_description_c = analyze_url_structure_c = None
+
+# Precompiled patterns used on every score
+_RE_DOUBLE_WS = re.compile(r'\s{2,}')
+# Characters allowed in a clean (lowercased) URL path
+_URL_OK_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789-/')
+# Opening heading tags; the level is all analyze_headings needs, so no DOM is built
+_RE_HEADINGS = re.compile(r'<h([1-6])\b', re.IGNORECASE)
+_RE_HEADINGS_BYTES = re.compile(rb'<h([1-6])\b', re.IGNORECASE)
+
+# Weight of each component in the overall score (total = 100)
+_WEIGHTS = (
+    ('title', 15),
+    ('meta_description', 10),
+    ('url_structure', 10),
+    ('headings', 10),
+    ('content', 20),
+    ('links', 10),
+    ('mobile_friendly', 10),
+    ('load_speed', 10),
+    ('technical', 5),
+)
+
+# Placeholder scores for components that aren't measured yet
+_SIMULATED_SCORES = {
+    'headings': 80,
+    'content': 75,
+    'links': 70,
+    'mobile_friendly': 90,
+    'load_speed': 85,
+}
+
 class SEOScorer:
     def __init__(self, crawled_data: Dict[str, Any]):
         self.data = crawled_data
@@ -25,28 +63,19 @@ class SEOScorer:
         
     def calculate_overall_score(self) -> int:
         """Calculate the final SEO score (0-100) based on weighted factors."""
-        # Define weights for each factor (total = 100)
-        weights = {
-            'title': 15,
-            'meta_description': 10,
-            'url_structure': 10,
-            'headings': 10,
-            'content': 20,
-            'links': 10,
-            'mobile_friendly': 10,
-            'load_speed': 10,
-            'technical': 5
-        }
-        
-        # Calculate weighted score
-        total_score = sum(self.scores[key] * weights[key] / 100 for key in weights.keys())
-        return round(total_score)
+        # Per-term `* w / 100` (rather than pre-divided float weights) keeps rounding identical
+        return round(sum(self.scores[key] * w / 100 for key, w in _WEIGHTS))
 
     def analyze_title(self, title: str) -> float:
         """
         Score title tag based on length and keyword presence
         Returns score 0-100
         """
+        if analyze_title_c is not None:
+            return analyze_title_c(title)
+        return self._analyze_title_py(title)
+
+    def _analyze_title_py(self, title: str) -> float:
         if not title or title == "N/A":
             return 0
         
@@ -62,17 +91,23 @@ class SEOScorer:
             score -= 10  # Not optimal but acceptable
             
         # Check for common issues
+        # isupper()/islower() are mutually exclusive, so skip the second scan on a hit
         if title.isupper():
             score -= 10  # ALL CAPS titles are not recommended
-        if title.islower():
+        elif title.islower():
             score -= 5   # all lowercase titles are not optimal
-        if re.search(r'\s{2,}', title):
+        if _RE_DOUBLE_WS.search(title):
             score -= 5   # Multiple spaces
             
         return max(0, score)
 
     def analyze_meta_description(self, description: str) -> float:
         """Score meta description based on length and content quality"""
+        if analyze_meta_description_c is not None:
+            return analyze_meta_description_c(description)
+        return self._analyze_meta_description_py(description)
+
+    def _analyze_meta_description_py(self, description: str) -> float:
         if not description or description == "N/A":
             return 0
             
@@ -97,6 +132,11 @@ class SEOScorer:
 
     def analyze_url_structure(self, url: str) -> float:
         """Score URL structure based on SEO best practices"""
+        if analyze_url_structure_c is not None:
+            return analyze_url_structure_c(url)
+        return self._analyze_url_structure_py(url)
+
+    def _analyze_url_structure_py(self, url: str) -> float:
         score = 100
         parsed_url = urlparse(url)
         path = parsed_url.path.lower()
@@ -105,41 +145,47 @@ class SEOScorer:
         if len(url) > 100:
             score -= 20
         
-        # Check for URL clarity
-        if re.search(r'[^a-z0-9-/]', path):
+        # Check for URL clarity (set membership stops at the first offending character)
+        if not _URL_OK_CHARS.issuperset(path):
             score -= 15  # Contains special characters
             
         # Check for multiple consecutive hyphens
         if '--' in path:
             score -= 10
             
-        # Check depth (number of folders)
-        depth = len([x for x in path.split('/') if x])
+        # Check depth (number of folders); empty segments come from leading/trailing/double slashes
+        segments = path.split('/')
+        depth = len(segments) - segments.count('')
         if depth > 3:
             score -= 5 * (depth - 3)  # Penalty for deep nesting
             
         return max(0, score)
 
-    def analyze_headings(self, html_content: str) -> float:
-        """Score heading structure and hierarchy"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+    def analyze_headings(self, html_content: Union[str, bytes]) -> float:
+        """
+        Score heading structure and hierarchy.
+        Headings are found with a regex sweep over the raw markup, so tags inside
+        <script> or comments also count; that's acceptable noise for scoring.
+        """
+        pattern = _RE_HEADINGS_BYTES if isinstance(html_content, bytes) else _RE_HEADINGS
         score = 100
         
-        # Check for H1
-        h1_tags = soup.find_all('h1')
-        if not h1_tags:
-            score -= 50  # No H1 tag
-        elif len(h1_tags) > 1:
-            score -= 20  # Multiple H1 tags
-            
-        # Check heading hierarchy
-        heading_levels = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+        # Count H1s and check heading hierarchy in a single pass
+        h1_count = 0
         previous_level = 0
-        for tag in soup.find_all(heading_levels):
-            current_level = int(tag.name[1])
+        for match in pattern.finditer(html_content):
+            current_level = int(match.group(1))
+            if current_level == 1:
+                h1_count += 1
             if current_level - previous_level > 1:
                 score -= 5  # Skipped heading level
             previous_level = current_level
+        
+        # Check for H1
+        if not h1_count:
+            score -= 50  # No H1 tag
+        elif h1_count > 1:
+            score -= 20  # Multiple H1 tags
             
         return max(0, score)
 
@@ -177,11 +223,7 @@ class SEOScorer:
         
         # Additional scoring components would be calculated here
         # For now, we'll use simulated scores for remaining factors
-        self.scores['headings'] = 80  # Simulated score
-        self.scores['content'] = 75   # Simulated score
-        self.scores['links'] = 70     # Simulated score
-        self.scores['mobile_friendly'] = 90  # Simulated score
-        self.scores['load_speed'] = 85      # Simulated score
+        self.scores.update(_SIMULATED_SCORES)
         
         return {
             'overall_score': self.calculate_overall_score(),
@@ -189,6 +231,78 @@ class SEOScorer:
             'recommendations': self.generate_recommendations()
         }
 
+    @staticmethod
+    def score_batch(records: "pd.DataFrame") -> "pd.DataFrame":
+        """
+        Vectorized scoring for bulk audits: one row per page with 'title', 'meta_description'
+        and 'url' columns, plus optional 'mobile_friendly', 'page_load_time_s' and
+        'structured_data_present' metric columns. Returns the component scores and
+        'overall_score' per row, matching calculate_scores() for single pages.
+        """
+        # Only bulk audits pay for the NumPy/pandas import
+        import numpy as np
+        import pandas as pd
+
+        def text_column(name: str) -> "pd.Series":
+            if name not in records:
+                return pd.Series('', index=records.index, dtype=object)
+            return records[name].fillna('').astype(str)
+
+        # --- Title ---
+        title = text_column('title')
+        length = title.str.len()
+        score = 100 - np.select([length < 30, length > 60, (length < 40) | (length > 50)], [30, 20, 10], 0)
+        score -= np.where(title.str.isupper(), 10, np.where(title.str.islower(), 5, 0))
+        score -= np.where(title.str.contains(_RE_DOUBLE_WS), 5, 0)
+        title_score = np.where((title == '') | (title == 'N/A'), 0, np.maximum(0, score))
+
+        # --- Meta description ---
+        desc = text_column('meta_description')
+        length = desc.str.len()
+        score = 100 - np.select([length < 120, length > 160, length < 140], [30, 20, 10], 0)
+        score -= np.where(desc.str.contains('[.!?]'), 0, 10)
+        score -= np.where(desc.str.count(' ') < 10, 20, 0)
+        desc_score = np.where((desc == '') | (desc == 'N/A'), 0, np.maximum(0, score))
+
+        # --- URL structure (urlparse has no vectorized form; the checks on the path do) ---
+        url = text_column('url')
+        path = pd.Series([urlparse(u).path for u in url], index=records.index, dtype=object).str.lower()
+        depth = path.str.count('[^/]+')
+        score = 100 - np.where(url.str.len() > 100, 20, 0)
+        score -= np.where(path.str.contains('[^a-z0-9-/]'), 15, 0)
+        score -= np.where(path.str.contains('--', regex=False), 10, 0)
+        score -= np.where(depth > 3, 5 * (depth - 3), 0)
+        url_score = np.maximum(0, score)
+
+        # --- Technical factors ---
+        if 'mobile_friendly' in records:
+            mobile = records['mobile_friendly'] == 'Yes'
+        else:
+            mobile = pd.Series(False, index=records.index)
+        if 'page_load_time_s' in records:
+            load_time = records['page_load_time_s'].fillna(5).astype(float)
+        else:
+            load_time = pd.Series(5.0, index=records.index)
+        score = 100 - np.where(mobile, 0, 30)
+        score -= np.select([load_time > 3, load_time > 2], [20, 10], 0)
+        score -= np.where(text_column('structured_data_present').str.contains('Missing', regex=False), 15, 0)
+        technical_score = np.maximum(0, score)
+
+        scores = pd.DataFrame({
+            'title': title_score,
+            'meta_description': desc_score,
+            'url_structure': url_score,
+            'technical': technical_score,
+            **_SIMULATED_SCORES,
+        }, index=records.index)
+
+        # Same term order and `* w / 100` as calculate_overall_score, so rounding matches
+        total = 0
+        for key, w in _WEIGHTS:
+            total = total + scores[key] * w / 100
+        scores['overall_score'] = np.round(total).astype(int)
+        return scores
+
     def generate_recommendations(self) -> List[Dict[str, str]]:
         """Generate specific recommendations based on scores"""
         recommendations = []
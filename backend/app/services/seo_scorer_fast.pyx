@@ -0,0 +1,126 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# backend/app/services/seo_scorer_fast.pyx
+"""
+Compiled versions of the per-page SEOScorer checks (title, meta description, URL structure).
+They mirror the pure-Python methods in seo_scorer.py exactly; SEOScorer falls back to those
+when this extension isn't built. Build in place from backend/ with:
+
+    cythonize -i app/services/seo_scorer_fast.pyx
+"""
+
+from cpython.unicode cimport Py_UNICODE_ISSPACE
+from urllib.parse import urlparse
+
+cpdef int analyze_title_c(str title) except -1:
+    """Compiled SEOScorer.analyze_title."""
+    if not title or title == "N/A":
+        return 0
+
+    cdef int score = 100
+    cdef Py_ssize_t length = len(title)
+    cdef Py_UCS4 ch
+    cdef bint prev_space = False
+    cdef bint double_space = False
+
+    # Length penalties
+    if length < 30:
+        score -= 30  # Too short
+    elif length > 60:
+        score -= 20  # Too long
+    elif length < 40 or length > 50:
+        score -= 10  # Not optimal but acceptable
+
+    # Case rules depend on Unicode cased/uncased characters, so keep the str methods
+    if title.isupper():
+        score -= 10  # ALL CAPS titles are not recommended
+    elif title.islower():
+        score -= 5   # all lowercase titles are not optimal
+
+    # Same as re.search(r'\s{2,}'): \s on str patterns is str.isspace()
+    for ch in title:
+        if Py_UNICODE_ISSPACE(ch):
+            if prev_space:
+                double_space = True
+                break
+            prev_space = True
+        else:
+            prev_space = False
+    if double_space:
+        score -= 5   # Multiple spaces
+
+    return score if score > 0 else 0
+
+cpdef int analyze_meta_description_c(str description) except -1:
+    """Compiled SEOScorer.analyze_meta_description."""
+    if not description or description == "N/A":
+        return 0
+
+    cdef int score = 100
+    cdef Py_ssize_t length = len(description)
+    cdef Py_ssize_t spaces = 0
+    cdef bint punctuated = False
+    cdef Py_UCS4 ch
+
+    # Length scoring
+    if length < 120:
+        score -= 30  # Too short
+    elif length > 160:
+        score -= 20  # Too long
+    elif length < 140:
+        score -= 10  # Not optimal but acceptable
+
+    # Content quality checks, counted in one pass
+    for ch in description:
+        if ch == u' ':
+            spaces += 1
+        elif ch == u'.' or ch == u'!' or ch == u'?':
+            punctuated = True
+    if not punctuated:
+        score -= 10  # No proper punctuation
+    if spaces < 10:
+        score -= 20  # Too few words
+
+    return score if score > 0 else 0
+
+cpdef int analyze_url_structure_c(str url) except -1:
+    """Compiled SEOScorer.analyze_url_structure."""
+    cdef int score = 100
+    cdef str path = urlparse(url).path
+    cdef Py_UCS4 ch
+    cdef Py_UCS4 prev = u'/'
+    cdef bint bad_char = False
+    cdef bint double_hyphen = False
+    cdef int depth = 0
+
+    # Check URL length
+    if len(url) > 100:
+        score -= 20
+
+    # One pass over the path: special characters, consecutive hyphens and folder depth.
+    # ASCII letters are lowercased implicitly by accepting both cases; U+212A (KELVIN SIGN)
+    # is the one other character str.lower() turns into an allowed one ('k').
+    for ch in path:
+        if ch == u'/':
+            pass
+        elif ch == u'-':
+            if prev == u'-':
+                double_hyphen = True
+        elif not (u'a' <= ch <= u'z' or u'A' <= ch <= u'Z' or u'0' <= ch <= u'9' or ch == 0x212A):
+            bad_char = True
+        if prev == u'/' and ch != u'/':
+            depth += 1  # First character of a non-empty folder
+        prev = ch
+
+    # Check for URL clarity
+    if bad_char:
+        score -= 15  # Contains special characters
+
+    # Check for multiple consecutive hyphens
+    if double_hyphen:
+        score -= 10
+
+    # Check depth (number of folders)
+    if depth > 3:
+        score -= 5 * (depth - 3)  # Penalty for deep nesting
+
+    return score if score > 0 else 0
@@ -1,30 +1,53 @@
-from crawler import detect_platform
-from bs4 import BeautifulSoup
+from crawler import detect_platform, extract_generator
+from selectolax.lexbor import LexborHTMLParser
 import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared keep-alive session so consecutive probes skip repeated TLS handshakes
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=Retry(total=2, backoff_factor=0.3))
+_SESSION.mount('http://', _adapter)
+_SESSION.mount('https://', _adapter)
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Connection': 'keep-alive'
+})
+
+_PRINT_LOCK = threading.Lock()
 
 def test_detection(url):
-    print(f"\nTesting URL: {url}")
+    # Buffer this URL's report and print it in one go so concurrent runs don't interleave
+    lines = [f"\nTesting URL: {url}"]
     try:
-        response = requests.get(url, timeout=10, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        response = _SESSION.get(url, timeout=10)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        tree = LexborHTMLParser(response.content)
         
-        platform_info = detect_platform(soup, str(soup), url)
-        print("\nPlatform Detection Results:")
-        print("-" * 30)
-        print(f"CMS: {platform_info['cms']}")
-        print(f"Framework: {platform_info['framework']}")
-        print(f"Hosting: {platform_info['hosting']}")
-        print("\nTechnologies:")
+        platform_info = detect_platform(response.text.lower(), url, extract_generator(tree))
+        lines.append("\nPlatform Detection Results:")
+        lines.append("-" * 30)
+        lines.append(f"CMS: {platform_info['cms']}")
+        lines.append(f"Framework: {platform_info['framework']}")
+        lines.append(f"Hosting: {platform_info['hosting']}")
+        lines.append("\nTechnologies:")
         for tech in platform_info['technologies']:
-            print(f"- {tech}")
+            lines.append(f"- {tech}")
             
     except Exception as e:
-        print(f"Error: {str(e)}")
+        lines.append(f"Error: {str(e)}")
+
+    with _PRINT_LOCK:
+        print("\n".join(lines))
+
+test_urls = [
+    "https://wordpress.org",  # Test with WordPress
+    "https://reactjs.org",    # Test with a known React site
+]
 
-# Test with WordPress
-test_detection("https://wordpress.org")
-# Test with a known React site
-test_detection("https://reactjs.org")
\ No newline at end of file
+with ThreadPoolExecutor(max_workers=min(16, len(test_urls))) as ex:
+    futures = {ex.submit(test_detection, u): u for u in test_urls}
+    for f in as_completed(futures):
+        f.result()
\ No newline at end of file
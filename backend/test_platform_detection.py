@@ -1,10 +1,11 @@
-import requests
-import json
+import asyncio
+import httpx
 
-def test_seo_audit(url):
-    print(f"\nTesting URL: {url}")
+async def test_seo_audit(client, url):
+    # Buffer this URL's report and print it in one go so concurrent runs don't interleave
+    lines = [f"\nTesting URL: {url}"]
     try:
-        response = requests.post(
+        response = await client.post(
             "http://localhost:8000/analyze",
             json={"url": url}
         )
@@ -12,17 +13,19 @@ def test_seo_audit(url):
         
         # Extract platform info
         platform_info = data.get("platform_info", {})
-        print("\nPlatform Detection Results:")
-        print("-" * 30)
-        print(f"CMS: {platform_info.get('cms', 'Unknown')}")
-        print(f"Framework: {platform_info.get('framework', 'Unknown')}")
-        print(f"Hosting: {platform_info.get('hosting', 'Unknown')}")
-        print("\nTechnologies:")
+        lines.append("\nPlatform Detection Results:")
+        lines.append("-" * 30)
+        lines.append(f"CMS: {platform_info.get('cms', 'Unknown')}")
+        lines.append(f"Framework: {platform_info.get('framework', 'Unknown')}")
+        lines.append(f"Hosting: {platform_info.get('hosting', 'Unknown')}")
+        lines.append("\nTechnologies:")
         for tech in platform_info.get("technologies", []):
-            print(f"- {tech}")
+            lines.append(f"- {tech}")
             
     except Exception as e:
-        print(f"Error: {str(e)}")
+        lines.append(f"Error: {str(e)}")
+
+    print("\n".join(lines))
 
 # Test with different types of websites
 test_urls = [
@@ -34,5 +37,10 @@ test_urls = [
     "https://www.netlify.com",          # Netlify
 ]
 
-for url in test_urls:
-    test_seo_audit(url)
\ No newline at end of file
+async def main():
+    # One pooled client for the whole batch; the audits are I/O bound, so run them concurrently
+    # (each audit can take a while: crawl + Gemini)
+    async with httpx.AsyncClient(http2=True, timeout=120) as client:
+        await asyncio.gather(*[test_seo_audit(client, u) for u in test_urls])
+
+asyncio.run(main())
\ No newline at end of file